@@ -1,34 +1,89 @@
 import sys
 import json
+import bisect
 import os
 import random
-import time
+from collections import Counter, defaultdict
+from itertools import islice
+
+# orjson is optional; it parses and serializes far faster than the stdlib json module.
+# Both paths produce the same 2-space indented UTF-8 file.
+try:
+    import orjson
+
+    def dump_json(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    load_json = orjson.loads
+except ImportError:
+    def dump_json(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    load_json = json.loads
+
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QHBoxLayout, QTabWidget, QLineEdit, QPushButton, 
-                               QTableWidget, QTableWidgetItem, QHeaderView, 
+                               QTableView, QHeaderView, 
                                QMessageBox, QGridLayout, QSizePolicy, QLabel,
-                               QCheckBox, QSpinBox, QDialog, QFrame, QScrollArea)
+                               QCheckBox, QSpinBox, QDialog,
+                               QStyledItemDelegate, QStyle, QCompleter)
 from PySide6.QtGui import QFont, QColor, QPalette
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import (Qt, QTimer, QEvent, Signal, Slot, QStringListModel, QObject,
+                            QRunnable, QThreadPool, QAbstractTableModel, QModelIndex)
+
+# On-screen keyboard layout (ЙЦУКЕН)
+KEY_ROW_YO = ("ё",)
+KEY_ROW_1 = ("й", "ц", "у", "к", "е", "н", "г", "ш", "щ", "з", "х", "ъ")
+KEY_ROW_2 = ("ф", "ы", "в", "а", "п", "р", "о", "л", "д", "ж", "э")
+KEY_ROW_3 = ("я", "ч", "с", "м", "и", "т", "ь", "б", "ю")
+KEY_PUNCTUATION = (",", ".", "!", "?")
+
+# Max suggestions shown while typing in the Russian field
+AUTOCOMPLETE_LIMIT = 10
+
+# Idle time after the last change before data is written to disk
+SAVE_DELAY_MS = 2000
+
+# Shared fonts, applied with setFont() so stylesheets only carry colours and borders
+def _make_font(pixel_size, bold=False, italic=False):
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    font.setItalic(italic)
+    return font
+
+FONT_CARD_QUESTION = _make_font(32, bold=True)
+FONT_CARD_ANSWER = _make_font(24, italic=True)
+FONT_PAIR_BTN = _make_font(20)
+FONT_PAIR_BTN_BOLD = _make_font(20, bold=True)
+FONT_TITLE = _make_font(18, bold=True)
+FONT_BUTTON = _make_font(16, bold=True)
+FONT_STATUS = _make_font(16)
+FONT_SECTION = _make_font(14, bold=True)
+FONT_SMALL = _make_font(14)
+# Bold version of the 14pt window font, for controls that sit with regular window text
+FONT_TOGGLE = QFont()
+FONT_TOGGLE.setPointSize(14)
+FONT_TOGGLE.setBold(True)
 
 # --- FLASHCARD DIALOG ---
 class FlashcardDialog(QDialog):
+    KNOW_BTN_QSS = "background-color: #2e7d32; color: white;"
+    DONT_KNOW_BTN_QSS = "background-color: #c62828; color: white;"
+
     def __init__(self, items, max_score=10, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Practice Mode")
         self.resize(400, 300)
         
-        self.items = items
-        self.max_score = max_score
-        self.current_index = 0
-        
         # UI Setup
         self.layout = QVBoxLayout(self)
         
         # Progress Label
-        self.progress_label = QLabel(f"Card 1 of {len(items)}")
+        self.progress_label = QLabel()
         self.progress_label.setAlignment(Qt.AlignCenter)
-        self.progress_label.setStyleSheet("color: #777; font-size: 14px;")
+        self.progress_label.setFont(FONT_SMALL)
+        self.progress_label.setStyleSheet("color: #777;")
         self.layout.addWidget(self.progress_label)
         
         # Card Container (Centered)
@@ -40,7 +95,8 @@ class FlashcardDialog(QDialog):
         self.russian_label = QLabel()
         self.russian_label.setAlignment(Qt.AlignCenter)
         self.russian_label.setWordWrap(True)
-        self.russian_label.setStyleSheet("font-size: 32px; font-weight: bold; color: white;")
+        self.russian_label.setFont(FONT_CARD_QUESTION)
+        self.russian_label.setStyleSheet("color: white;")
         self.card_container.addWidget(self.russian_label)
         
         # Spacing
@@ -50,7 +106,8 @@ class FlashcardDialog(QDialog):
         self.english_label = QLabel()
         self.english_label.setAlignment(Qt.AlignCenter)
         self.english_label.setWordWrap(True)
-        self.english_label.setStyleSheet("font-size: 24px; color: #aaa; font-style: italic;")
+        self.english_label.setFont(FONT_CARD_ANSWER)
+        self.english_label.setStyleSheet("color: #aaa;")
         self.card_container.addWidget(self.english_label)
         
         self.layout.addStretch()
@@ -61,19 +118,21 @@ class FlashcardDialog(QDialog):
         # 1. "I Know This" Button (Green)
         self.btn_know = QPushButton("I Know This (+1)")
         self.btn_know.setMinimumHeight(50)
-        self.btn_know.setStyleSheet("background-color: #2e7d32; color: white; font-weight: bold; font-size: 16px;")
+        self.btn_know.setFont(FONT_BUTTON)
+        self.btn_know.setStyleSheet(self.KNOW_BTN_QSS)
         self.btn_know.clicked.connect(self.mark_known)
         
         # 2. "I Don't Know" Button (Red)
         self.btn_dont_know = QPushButton("I Don't Know (-1)")
         self.btn_dont_know.setMinimumHeight(50)
-        self.btn_dont_know.setStyleSheet("background-color: #c62828; color: white; font-weight: bold; font-size: 16px;")
+        self.btn_dont_know.setFont(FONT_BUTTON)
+        self.btn_dont_know.setStyleSheet(self.DONT_KNOW_BTN_QSS)
         self.btn_dont_know.clicked.connect(self.mark_unknown)
         
         # 3. "Next" Button (Neutral - initially hidden)
         self.btn_next = QPushButton("Next Card")
         self.btn_next.setMinimumHeight(50)
-        self.btn_next.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self.btn_next.setFont(FONT_TITLE)
         self.btn_next.clicked.connect(self.next_card)
         self.btn_next.hide()
 
@@ -83,6 +142,14 @@ class FlashcardDialog(QDialog):
         
         self.layout.addLayout(self.button_layout)
         
+        self.reset(items, max_score)
+
+    def reset(self, items, max_score=10):
+        """Starts a new session with the given cards, reusing the existing widgets."""
+        self.items = items
+        self.max_score = max_score
+        self.current_index = 0
+        self.btn_next.setText("Next Card")
         self.show_card()
 
     def show_card(self):
@@ -101,17 +168,19 @@ class FlashcardDialog(QDialog):
         
         self.progress_label.setText(f"Card {self.current_index + 1} of {len(self.items)}")
 
+    @Slot()
     def mark_known(self):
         """User guessed right. Add 1, CAP at max_score."""
         item = self.items[self.current_index]
-        current_score = item.get('score', 0)
+        current_score = item['score']
         item['score'] = min(current_score + 1, self.max_score)
         self.reveal_answer()
 
+    @Slot()
     def mark_unknown(self):
         """User guessed wrong. Subtract 1, NO FLOOR."""
         item = self.items[self.current_index]
-        current_score = item.get('score', 0)
+        current_score = item['score']
         item['score'] = current_score - 1
         self.reveal_answer()
 
@@ -128,6 +197,7 @@ class FlashcardDialog(QDialog):
         if self.current_index == len(self.items) - 1:
             self.btn_next.setText("Finish Practice")
 
+    @Slot()
     def next_card(self):
         """Move to next index or close."""
         if self.current_index < len(self.items) - 1:
@@ -138,20 +208,31 @@ class FlashcardDialog(QDialog):
 
 # --- MATCHING DIALOG ---
 class MatchingDialog(QDialog):
+    # Button stylesheets per state, built once for every dialog; fonts are in PAIR_FONTS
+    _BTN_BASE_QSS = """
+        QPushButton { border-radius: 8px; padding: 5px; border: 2px solid #555; }
+    """
+    STYLES = {
+        "neutral": _BTN_BASE_QSS + "QPushButton { background-color: #333; color: white; } QPushButton:hover { background-color: #444; }",
+        "selected": _BTN_BASE_QSS + "QPushButton { background-color: #fbc02d; color: black; border: 2px solid #ffeb3b; }",
+        "correct": _BTN_BASE_QSS + "QPushButton { background-color: #2e7d32; color: white; border: 2px solid #4caf50; }",
+        "wrong": _BTN_BASE_QSS + "QPushButton { background-color: #c62828; color: white; border: 2px solid #ff5252; }",
+    }
+    # Only neutral buttons are drawn in the regular weight
+    PAIR_FONTS = {
+        "neutral": FONT_PAIR_BTN,
+        "selected": FONT_PAIR_BTN_BOLD,
+        "correct": FONT_PAIR_BTN_BOLD,
+        "wrong": FONT_PAIR_BTN_BOLD,
+    }
+
     def __init__(self, items, max_score=10, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Matching Exercise")
         self.resize(600, 600) 
         
         # We process items in chunks of 10
-        self.all_items = items
-        self.max_score = max_score
         self.round_size = 10
-        self.current_round = 0
-        self.total_rounds = (len(items) + self.round_size - 1) // self.round_size
-        
-        self.selected_russian = None 
-        self.selected_english = None 
         
         # UI Setup
         self.layout = QVBoxLayout(self)
@@ -159,7 +240,8 @@ class MatchingDialog(QDialog):
         # Header
         self.header_label = QLabel()
         self.header_label.setAlignment(Qt.AlignCenter)
-        self.header_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #ddd;")
+        self.header_label.setFont(FONT_TITLE)
+        self.header_label.setStyleSheet("color: #ddd;")
         self.layout.addWidget(self.header_label)
         
         # Game Area
@@ -167,10 +249,16 @@ class MatchingDialog(QDialog):
         self.grid = QGridLayout(self.game_area)
         self.layout.addWidget(self.game_area)
         
+        # One fixed set of buttons per column, relabelled each round instead of rebuilt
+        self.russian_btns = [self.create_pair_btn("russian") for _ in range(self.round_size)]
+        self.english_btns = [self.create_pair_btn("english") for _ in range(self.round_size)]
+        for row, (r_btn, e_btn) in enumerate(zip(self.russian_btns, self.english_btns)):
+            self.grid.addWidget(r_btn, row, 0)
+            self.grid.addWidget(e_btn, row, 1)
+        
         # Status/Result message
         self.status_label = QLabel("Select a pair to match.")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("font-size: 16px; color: #aaa; margin-top: 10px;")
         self.layout.addWidget(self.status_label)
 
         # Next Round / Finish Button
@@ -180,6 +268,22 @@ class MatchingDialog(QDialog):
         self.action_btn.hide()
         self.layout.addWidget(self.action_btn)
         
+        self.reset(items, max_score)
+
+    def reset(self, items, max_score=10):
+        """Starts a new exercise with the given items, reusing the existing widgets."""
+        self.all_items = items
+        self.max_score = max_score
+        self.current_round = 0
+        self.total_rounds = (len(items) + self.round_size - 1) // self.round_size
+        
+        self.selected_russian = None 
+        self.selected_english = None 
+        
+        # The previous exercise may have left the status in its "wrong"/"complete" look
+        self.status_label.setFont(FONT_STATUS)
+        self.status_label.setStyleSheet("color: #aaa; margin-top: 10px;")
+        
         self.start_round()
 
     def start_round(self):
@@ -187,10 +291,6 @@ class MatchingDialog(QDialog):
         self.action_btn.hide()
         self.status_label.setText("Select a Russian word and its English definition.")
         
-        # Clear grid
-        for i in reversed(range(self.grid.count())): 
-            self.grid.itemAt(i).widget().setParent(None)
-            
         # Get chunk
         start = self.current_round * self.round_size
         end = start + self.round_size
@@ -198,47 +298,51 @@ class MatchingDialog(QDialog):
         
         self.header_label.setText(f"Round {self.current_round + 1} of {self.total_rounds}")
         
-        # Create lists for columns
-        russian_btns = []
-        english_btns = []
-        
-        for item in current_items:
-            # Russian Button
-            r_btn = QPushButton(item['russian'])
-            r_btn.setMinimumHeight(50)
-            r_btn.setCheckable(True)
-            r_btn.setStyleSheet(self.get_btn_style("neutral"))
-            r_btn.item_data = item 
-            r_btn.type = "russian"
-            r_btn.clicked.connect(lambda checked=False, b=r_btn: self.handle_click(b))
-            russian_btns.append(r_btn)
-            
-            # English Button
-            e_btn = QPushButton(item['english'])
-            e_btn.setMinimumHeight(50)
-            e_btn.setCheckable(True)
-            e_btn.setStyleSheet(self.get_btn_style("neutral"))
-            e_btn.item_data = item
-            e_btn.type = "english"
-            e_btn.clicked.connect(lambda checked=False, b=e_btn: self.handle_click(b))
-            english_btns.append(e_btn)
-            
-        # Shuffle English buttons so they don't align perfectly
-        random.shuffle(english_btns)
+        # Shuffle English column so it doesn't align with the Russian one
+        english_items = list(current_items)
+        random.shuffle(english_items)
         
-        # Add to Grid (Left: Russian, Right: English)
-        for i, r_btn in enumerate(russian_btns):
-            self.grid.addWidget(r_btn, i, 0)
-            
-        for i, e_btn in enumerate(english_btns):
-            self.grid.addWidget(e_btn, i, 1)
+        # Left: Russian, Right: English
+        for btn, item in zip(self.russian_btns, current_items):
+            self.reset_pair_btn(btn, item, item['russian'])
+        for btn, item in zip(self.english_btns, english_items):
+            self.reset_pair_btn(btn, item, item['english'])
+        
+        # A short final round leaves some rows unused
+        for btn in self.russian_btns[len(current_items):] + self.english_btns[len(current_items):]:
+            btn.hide()
             
         self.remaining_pairs = len(current_items)
 
+    def create_pair_btn(self, btn_type):
+        btn = QPushButton()
+        btn.setMinimumHeight(50)
+        btn.setCheckable(True)
+        btn.type = btn_type
+        btn.clicked.connect(self.on_pair_btn_clicked)
+        return btn
+
+    def set_pair_style(self, btn, state):
+        btn.setFont(self.PAIR_FONTS[state])
+        btn.setStyleSheet(self.STYLES[state])
+
+    def reset_pair_btn(self, btn, item, text):
+        """Points a pooled button at a new item and returns it to the neutral state."""
+        btn.setText(text)
+        btn.item_data = item
+        btn.setEnabled(True)
+        btn.setChecked(False)
+        self.set_pair_style(btn, "neutral")
+        btn.show()
+
+    @Slot()
+    def on_pair_btn_clicked(self):
+        self.handle_click(self.sender())
+
     def handle_click(self, btn):
         if (btn == self.selected_russian) or (btn == self.selected_english):
             btn.setChecked(False)
-            btn.setStyleSheet(self.get_btn_style("neutral"))
+            self.set_pair_style(btn, "neutral")
             if btn.type == "russian": self.selected_russian = None
             else: self.selected_english = None
             return
@@ -247,16 +351,16 @@ class MatchingDialog(QDialog):
         if btn.type == "russian":
             if self.selected_russian:
                 self.selected_russian.setChecked(False)
-                self.selected_russian.setStyleSheet(self.get_btn_style("neutral"))
+                self.set_pair_style(self.selected_russian, "neutral")
             self.selected_russian = btn
-            btn.setStyleSheet(self.get_btn_style("selected"))
+            self.set_pair_style(btn, "selected")
             
         elif btn.type == "english":
             if self.selected_english:
                 self.selected_english.setChecked(False)
-                self.selected_english.setStyleSheet(self.get_btn_style("neutral"))
+                self.set_pair_style(self.selected_english, "neutral")
             self.selected_english = btn
-            btn.setStyleSheet(self.get_btn_style("selected"))
+            self.set_pair_style(btn, "selected")
 
         if self.selected_russian and self.selected_english:
             self.validate_match()
@@ -268,13 +372,13 @@ class MatchingDialog(QDialog):
         is_match = (r_item == e_item)
         
         if is_match:
-            self.selected_russian.setStyleSheet(self.get_btn_style("correct"))
-            self.selected_english.setStyleSheet(self.get_btn_style("correct"))
+            self.set_pair_style(self.selected_russian, "correct")
+            self.set_pair_style(self.selected_english, "correct")
             self.selected_russian.setEnabled(False)
             self.selected_english.setEnabled(False)
             
             # Score +1
-            current = r_item.get('score', 0)
+            current = r_item['score']
             r_item['score'] = min(current + 1, self.max_score)
             
             self.selected_russian = None
@@ -286,35 +390,36 @@ class MatchingDialog(QDialog):
                 
         else:
             self.status_label.setText("Incorrect match! Try again.")
-            self.status_label.setStyleSheet("font-size: 16px; color: #ff5555; font-weight: bold;")
+            self.status_label.setFont(FONT_BUTTON)
+            self.status_label.setStyleSheet("color: #ff5555;")
             
-            self.selected_russian.setStyleSheet(self.get_btn_style("wrong"))
-            self.selected_english.setStyleSheet(self.get_btn_style("wrong"))
+            self.set_pair_style(self.selected_russian, "wrong")
+            self.set_pair_style(self.selected_english, "wrong")
             
             # Score -1
-            r_item['score'] = r_item.get('score', 0) - 1
-            e_item['score'] = e_item.get('score', 0) - 1
+            r_item['score'] = r_item['score'] - 1
+            e_item['score'] = e_item['score'] - 1
 
-            QApplication.processEvents() 
+            # Keep our own references; the selection is cleared before the timer fires
+            r_btn, e_btn = self.selected_russian, self.selected_english
+            r_btn.setChecked(False)
+            e_btn.setChecked(False)
             
-            self.selected_russian.setChecked(False)
-            self.selected_english.setChecked(False)
-            
-            QTimer.singleShot(500, lambda: self.reset_wrong_buttons(self.selected_russian, self.selected_english))
+            QTimer.singleShot(500, lambda: self.reset_wrong_buttons(r_btn, e_btn))
             
             self.selected_russian = None
             self.selected_english = None
 
     def reset_wrong_buttons(self, btn1, btn2):
-        try:
-            if btn1: btn1.setStyleSheet(self.get_btn_style("neutral"))
-            if btn2: btn2.setStyleSheet(self.get_btn_style("neutral"))
-        except:
-            pass
+        for btn in (btn1, btn2):
+            # Leave buttons that were matched or selected again in the meantime
+            if btn.isEnabled() and btn is not self.selected_russian and btn is not self.selected_english:
+                self.set_pair_style(btn, "neutral")
 
     def finish_round(self):
         self.status_label.setText("Round Complete!")
-        self.status_label.setStyleSheet("font-size: 18px; color: #55ff55; font-weight: bold;")
+        self.status_label.setFont(FONT_TITLE)
+        self.status_label.setStyleSheet("color: #55ff55;")
         
         if self.current_round < self.total_rounds - 1:
             self.action_btn.setText("Start Next Round")
@@ -323,6 +428,7 @@ class MatchingDialog(QDialog):
             self.action_btn.setText("Finish Exercise")
             self.action_btn.show()
 
+    @Slot()
     def next_round(self):
         if self.current_round < self.total_rounds - 1:
             self.current_round += 1
@@ -330,20 +436,148 @@ class MatchingDialog(QDialog):
         else:
             self.accept()
 
-    def get_btn_style(self, state):
-        # UPDATED: Increased font-size to 20px
-        base = """
-            QPushButton { border-radius: 8px; font-size: 20px; font-weight: bold; padding: 5px; border: 2px solid #555; }
-        """
-        if state == "neutral":
-            return base + "QPushButton { background-color: #333; font-weight: normal; color: white; } QPushButton:hover { background-color: #444; }"
-        elif state == "selected":
-            return base + "QPushButton { background-color: #fbc02d; color: black; border: 2px solid #ffeb3b; }"
-        elif state == "correct":
-            return base + "QPushButton { background-color: #2e7d32; color: white; border: 2px solid #4caf50; }"
-        elif state == "wrong":
-            return base + "QPushButton { background-color: #c62828; color: white; border: 2px solid #ff5252; }"
-        return base
+# --- TABLE MODEL ---
+class VocabTableModel(QAbstractTableModel):
+    """Exposes one category's entry list to a QTableView without copying it."""
+    HEADERS = ("Russian", "English Definition", "Score", "")
+
+    def __init__(self, items, parent=None):
+        super().__init__(parent)
+        self.items = items # The live list from VocabVault.data
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.items[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return item["russian"]
+            if column == 1:
+                return item["english"]
+            if column == 2:
+                return item["score"] # ScoreDelegate formats and colours it
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        # Answer every case here rather than calling super(): under PySide6 that
+        # drops a reference to None per call and eventually aborts the interpreter.
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return section + 1 # Row numbers
+
+    def append_item(self, item):
+        row = len(self.items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.items.append(item)
+        self.endInsertRows()
+
+    def remove_item(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        item = self.items.pop(row)
+        self.endRemoveRows()
+        return item
+
+    def refresh_scores(self):
+        """Repaints the score column only; rows, scroll position and selection are untouched."""
+        if self.items:
+            self.dataChanged.emit(self.index(0, 2), self.index(len(self.items) - 1, 2),
+                                  [Qt.DisplayRole])
+
+# --- SCORE COLUMN DELEGATE ---
+class ScoreDelegate(QStyledItemDelegate):
+    """Draws the score centered, green when positive and red when negative."""
+    POSITIVE_COLOR = QColor("green")
+    NEGATIVE_COLOR = QColor("red")
+
+    def paint(self, painter, option, index):
+        score = index.data(Qt.DisplayRole)
+        # Background only (selection/hover), then the number on top
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+        
+        painter.save()
+        if score > 0:
+            painter.setPen(self.POSITIVE_COLOR)
+        elif score < 0:
+            painter.setPen(self.NEGATIVE_COLOR)
+        else:
+            painter.setPen(option.palette.color(QPalette.Text))
+        painter.drawText(option.rect, Qt.AlignCenter, str(score))
+        painter.restore()
+
+# --- DELETE COLUMN DELEGATE ---
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """Paints a ✕ in each cell of the delete column and reports clicks on it."""
+    delete_requested = Signal(int)
+    # Shared by the delegates of every table
+    COLOR = QColor("#d32f2f")
+    HOVER_COLOR = QColor("red")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.font = FONT_TITLE
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setFont(self.font)
+        hovered = option.state & QStyle.State_MouseOver
+        painter.setPen(self.HOVER_COLOR if hovered else self.COLOR)
+        painter.drawText(option.rect, Qt.AlignCenter, "✕")
+        painter.restore()
+
+    def createEditor(self, parent, option, index):
+        return None # Nothing to edit in this column
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            self.delete_requested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+# --- BACKGROUND SAVE ---
+class SaveSignals(QObject):
+    failed = Signal(str)
+
+class SaveWorker(QRunnable):
+    """Serializes a snapshot of the data and atomically replaces the json file."""
+    def __init__(self, snapshot, categories, filename):
+        super().__init__()
+        # {category: [((field, value), ...), ...]}, plus any other top-level keys unchanged
+        self.snapshot = snapshot
+        self.categories = categories
+        self.filename = filename
+        self.signals = SaveSignals()
+
+    def run(self):
+        tmp_filename = self.filename + ".tmp"
+        try:
+            data = {key: [dict(fields) for fields in value] if key in self.categories else value
+                    for key, value in self.snapshot.items()}
+            # Serialize up front so the file gets a single write() instead of one per token
+            payload = dump_json(data)
+            # Write beside the real file and rename over it, so a crash never leaves it half-written
+            with open(tmp_filename, 'wb', buffering=1 << 20) as f:
+                f.write(payload)
+            os.replace(tmp_filename, self.filename)
+        except Exception as e:
+            # Don't leave a partial temp file behind
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
+            self.signals.failed.emit(str(e))
 
 # --- MAIN WINDOW ---
 class VocabVault(QMainWindow):
@@ -362,47 +596,105 @@ class VocabVault(QMainWindow):
         
         self.filename = "russian.json"
         self.categories = ["words", "pronouns", "phrases", "sentences"]
+        self._display_names = {cat: cat.replace("all ", "").title() for cat in self.categories}
         self.tables = {} 
+        self.models = {} 
+        # Practice dialogs are built on first use and reset for later sessions
+        self._flashcard_dialog = None
+        self._matching_dialog = None
         self.letter_buttons = [] 
         self.is_shifted = False
         
+        # Deferred saving: mutations mark data dirty, and the save runs once they go quiet
+        self._dirty = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(SAVE_DELAY_MS)
+        self._flush_timer.timeout.connect(self._flush)
+        
+        # Single thread so saves land on disk in the order they were requested
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(1)
+        
         self.data = self.load_data()
+        # Russian text -> entry, per category, for O(1) duplicate checks
+        self.index = {cat: {item["russian"]: item for item in self.data[cat]}
+                      for cat in self.categories}
+        # Sorted (lowercased, original) Russian keys, per category, for prefix lookups
+        self.prefix_index = {cat: sorted((russian.lower(), russian) for russian in self.index[cat])
+                             for cat in self.categories}
+        # Entry counts per category, kept up to date by add/delete
+        self.counts = {cat: len(self.data[cat]) for cat in self.categories}
+        # How many entries hold each score, adjusted on every change instead of rescanning entries
+        self.score_histogram = Counter(item['score'] for cat in self.categories for item in self.data[cat])
+        # score -> {id(entry): entry}, per category. Scores span a small range, so weak picks
+        # walk a few buckets and a score change is a constant-time move between them.
+        self.score_buckets = {cat: defaultdict(dict) for cat in self.categories}
+        for cat in self.categories:
+            for item in self.data[cat]:
+                self.score_buckets[cat][item['score']][id(item)] = item
+        self._stats_template = "   |   ".join(f"{self._display_names[cat]}: {{}}"
+                                             for cat in self.categories)
         self.setup_ui()
 
     def load_data(self):
-        """Loads data from json, initializes structure and ensures 'score' exists."""
+        """Loads data from json, initializes structure and ensures every item field exists."""
         default_data = {cat: [] for cat in self.categories}
         
-        if not os.path.exists(self.filename):
-            return default_data
-            
         try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if not content or content == "{}":
-                    return default_data
-                data = json.loads(content)
-                
-                # Sanitize data: Ensure categories exist and items have scores
-                for cat in self.categories:
-                    if cat not in data:
-                        data[cat] = []
-                    # Backfill score for existing items
-                    for item in data[cat]:
-                        if "score" not in item:
-                            item["score"] = 0
-                            
-                return data
-        except json.JSONDecodeError:
+            with open(self.filename, 'rb') as f:
+                data = load_json(f.read()) or default_data
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        except (FileNotFoundError, json.JSONDecodeError):
             return default_data
+        
+        # Sanitize data: Ensure categories exist and items have text and scores
+        data.update({cat: [] for cat in self.categories if cat not in data})
+        for cat in self.categories:
+            # Backfill missing fields for existing items; interning shares repeated strings
+            for item in data[cat]:
+                item["russian"] = sys.intern(item.get("russian", ""))
+                item["english"] = sys.intern(item.get("english", ""))
+                if "score" not in item:
+                    item["score"] = 0
+                    
+        return data
 
     def save_data(self):
-        """Writes current data to json."""
-        try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not save data: {e}")
+        """Hands a snapshot of the current data to the save thread."""
+        # Entries become tuples of their fields, which are cheap to copy and keep any
+        # fields this app doesn't know about. Other top-level keys are never modified
+        # here, so they are passed through as they are.
+        snapshot = {key: [tuple(item.items()) for item in value] if key in self.categories else value
+                    for key, value in self.data.items()}
+        worker = SaveWorker(snapshot, frozenset(self.categories), self.filename)
+        worker.signals.failed.connect(self.on_save_failed)
+        self.save_pool.start(worker)
+
+    @Slot(str)
+    def on_save_failed(self, error):
+        QMessageBox.critical(self, "Error", f"Could not save data: {error}")
+
+    def _mark_dirty(self):
+        """Flags data as changed and (re)starts the save timer."""
+        self._dirty = True
+        self._flush_timer.start() # Restarting pushes the save back while edits keep coming
+
+    @Slot()
+    def _flush(self):
+        """Writes pending changes."""
+        if self._dirty:
+            self._dirty = False
+            self.save_data()
+
+    def closeEvent(self, event):
+        """Flush any pending save before the window goes away."""
+        self._flush_timer.stop()
+        if self._dirty:
+            self._dirty = False
+            self.save_data()
+        self.save_pool.waitForDone()
+        super().closeEvent(event)
 
     def setup_ui(self):
         central_widget = QWidget()
@@ -414,8 +706,9 @@ class VocabVault(QMainWindow):
         self.definitions_toggle = QCheckBox("Show Definitions")
         self.definitions_toggle.setChecked(True)
         self.definitions_toggle.toggled.connect(self.toggle_definitions)
+        self.definitions_toggle.setFont(FONT_TOGGLE)
         self.definitions_toggle.setStyleSheet("""
-            font-weight: bold; color: white; background-color: #333; 
+            color: white; background-color: #333; 
             padding: 4px; border-radius: 5px;
         """)
         top_bar.addStretch()
@@ -427,26 +720,13 @@ class VocabVault(QMainWindow):
         main_layout.addWidget(self.tabs)
         
         for category in self.categories:
+            # Models are cheap and always present; views are built when their tab is first shown
+            self.models[category] = VocabTableModel(self.data[category], self)
             tab = QWidget()
-            tab_layout = QVBoxLayout(tab)
-            
-            table = QTableWidget()
-            table.setColumnCount(4) 
-            table.setHorizontalHeaderLabels(["Russian", "English Definition", "Score", ""])
-            
-            header = table.horizontalHeader()
-            header.setSectionResizeMode(0, QHeaderView.Stretch)
-            header.setSectionResizeMode(1, QHeaderView.Stretch)
-            header.setSectionResizeMode(2, QHeaderView.Fixed) # Score width
-            table.setColumnWidth(2, 80)
-            header.setSectionResizeMode(3, QHeaderView.Fixed) # Button width
-            table.setColumnWidth(3, 60)
-            
-            self.tables[category] = table
-            self.refresh_table(category)
-            
-            tab_layout.addWidget(table)
-            self.tabs.addTab(tab, category.title())
+            QVBoxLayout(tab)
+            self.tabs.addTab(tab, self._display_names[category])
+        self.tabs.currentChanged.connect(self.ensure_tab_built)
+        self.ensure_tab_built(self.tabs.currentIndex())
 
         # 2. Input Area
         input_grid = QGridLayout()
@@ -454,6 +734,13 @@ class VocabVault(QMainWindow):
         self.russian_input = QLineEdit()
         self.russian_input.setPlaceholderText("Enter Russian word/phrase...")
         
+        # Suggest existing entries of the current tab as the user types
+        self.completion_model = QStringListModel(self)
+        completer = QCompleter(self.completion_model, self)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.russian_input.textEdited.connect(self.update_completions)
+        self.russian_input.setCompleter(completer)
+        
         self.english_input = QLineEdit()
         self.english_input.setPlaceholderText("Enter English definition...")
         
@@ -465,8 +752,9 @@ class VocabVault(QMainWindow):
         input_grid.addWidget(self.english_input, 0, 1)
         input_grid.addWidget(self.add_button, 0, 2)
         
-        keyboard_widget = self.create_keyboard()
-        input_grid.addWidget(keyboard_widget, 1, 0, alignment=Qt.AlignTop | Qt.AlignLeft)
+        # The keyboard is built right after the window first shows, see build_keyboard
+        self.input_grid = input_grid
+        QTimer.singleShot(0, self.build_keyboard)
         
         # Stats & Practice Container
         self.stats_container = QWidget()
@@ -475,7 +763,8 @@ class VocabVault(QMainWindow):
         
         # Stats Label
         self.stats_label = QLabel()
-        self.stats_label.setStyleSheet("color: #555; font-size: 16px;")
+        self.stats_label.setFont(FONT_STATUS)
+        self.stats_label.setStyleSheet("color: #555;")
         self.stats_label.setWordWrap(True)
         self.stats_layout.addWidget(self.stats_label)
         
@@ -483,7 +772,7 @@ class VocabVault(QMainWindow):
         
         # --- FLASHCARD PRACTICE ROW ---
         flashcard_label = QLabel("Practice Flashcards:")
-        flashcard_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        flashcard_label.setFont(FONT_SECTION)
         self.stats_layout.addWidget(flashcard_label)
         
         fc_row = QHBoxLayout()
@@ -510,7 +799,7 @@ class VocabVault(QMainWindow):
 
         # --- MATCHING GAME ROW ---
         matching_label = QLabel("Matching Exercise (10 pairs/card):")
-        matching_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        matching_label.setFont(FONT_SECTION)
         self.stats_layout.addWidget(matching_label)
 
         match_row = QHBoxLayout()
@@ -556,19 +845,24 @@ class VocabVault(QMainWindow):
         count = self.card_count_spin.value()
         
         if mode == "weak":
-            sorted_items = sorted(items, key=lambda x: x.get('score', 0))
-            selected_items = sorted_items[:count]
+            selected_items = self.weakest_items(current_category, count)
             random.shuffle(selected_items)
         else:
             sample_size = min(count, len(items))
-            selected_items = random.sample(items, sample_size)
+            # Sample positions rather than the entries themselves
+            idxs = random.sample(range(len(items)), sample_size)
+            selected_items = [items[i] for i in idxs]
             
-        dialog = FlashcardDialog(selected_items, max_score=self.MAX_SCORE, parent=self)
-        dialog.exec()
-        
-        self.save_data()
-        self.refresh_table(current_category)
-        self.update_stats()
+        old_scores = [item['score'] for item in selected_items]
+        if self._flashcard_dialog is None:
+            self._flashcard_dialog = FlashcardDialog(selected_items, max_score=self.MAX_SCORE, parent=self)
+        else:
+            self._flashcard_dialog.reset(selected_items, max_score=self.MAX_SCORE)
+        self._flashcard_dialog.exec()
+        if self.apply_score_changes(current_category, selected_items, old_scores):
+            self._mark_dirty()
+            self.models[current_category].refresh_scores()
+            self.update_stats()
 
     def start_matching(self, mode="random"):
         current_index = self.tabs.currentIndex()
@@ -589,19 +883,102 @@ class VocabVault(QMainWindow):
             return
 
         if mode == "weak":
-            sorted_items = sorted(items, key=lambda x: x.get('score', 0))
-            selected_items = sorted_items[:count]
+            selected_items = self.weakest_items(current_category, count)
             random.shuffle(selected_items)
         else:
-            selected_items = random.sample(items, count)
+            idxs = random.sample(range(len(items)), count)
+            selected_items = [items[i] for i in idxs]
 
-        dialog = MatchingDialog(selected_items, max_score=self.MAX_SCORE, parent=self)
-        dialog.exec()
+        old_scores = [item['score'] for item in selected_items]
+        if self._matching_dialog is None:
+            self._matching_dialog = MatchingDialog(selected_items, max_score=self.MAX_SCORE, parent=self)
+        else:
+            self._matching_dialog.reset(selected_items, max_score=self.MAX_SCORE)
+        self._matching_dialog.exec()
+        if self.apply_score_changes(current_category, selected_items, old_scores):
+            self._mark_dirty()
+            self.models[current_category].refresh_scores()
+            self.update_stats()
+
+    def weakest_items(self, category, count):
+        """Returns up to count entries of the category, lowest scores first."""
+        selected = []
+        buckets = self.score_buckets[category]
+        for score in sorted(buckets):
+            selected.extend(islice(buckets[score].values(), count - len(selected)))
+            if len(selected) >= count:
+                break
+        return selected
+
+    def apply_score_changes(self, category, items, old_scores):
+        """Updates the score histogram and buckets for items practiced in a session.
+        Returns whether any score actually changed."""
+        changed = False
+        for item, old_score in zip(items, old_scores):
+            new_score = item['score']
+            if new_score == old_score:
+                continue
+            changed = True
+            self._move_in_histogram(old_score, new_score)
+            self._move_in_buckets(category, item, old_score, new_score)
+        return changed
+
+    def _move_in_histogram(self, old_score, new_score):
+        self.score_histogram[old_score] -= 1
+        if not self.score_histogram[old_score]:
+            del self.score_histogram[old_score]
+        if new_score is not None:
+            self.score_histogram[new_score] += 1
+
+    def _move_in_buckets(self, category, item, old_score, new_score):
+        buckets = self.score_buckets[category]
+        bucket = buckets[old_score]
+        bucket.pop(id(item), None)
+        if not bucket:
+            del buckets[old_score]
+        if new_score is not None:
+            buckets[new_score][id(item)] = item
+
+    @Slot(int)
+    def ensure_tab_built(self, tab_index):
+        """Creates the table view for a category tab the first time it is shown."""
+        if tab_index < 0:
+            return
+        category = self.categories[tab_index]
+        if category in self.tables:
+            return
         
-        self.save_data()
-        self.refresh_table(current_category)
-        self.update_stats()
+        # The view only asks the model for rows it is actually drawing
+        table = QTableView()
+        table.setModel(self.models[category])
+        
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.Fixed) # Score width
+        table.setColumnWidth(2, 80)
+        header.setSectionResizeMode(3, QHeaderView.Fixed) # Button width
+        table.setColumnWidth(3, 60)
+        
+        table.setItemDelegateForColumn(2, ScoreDelegate(table))
+        
+        # One delegate draws every delete button instead of a widget per row
+        table.setMouseTracking(True)
+        delete_delegate = DeleteButtonDelegate(table)
+        delete_delegate.delete_requested.connect(lambda row, c=category: self.delete_entry(c, row))
+        table.setItemDelegateForColumn(3, delete_delegate)
+        
+        # Match the definitions toggle, which may have changed before this tab was opened
+        table.setColumnHidden(1, not self.definitions_toggle.isChecked())
+        
+        self.tables[category] = table
+        self.tabs.widget(tab_index).layout().addWidget(table)
+
+    @Slot()
+    def build_keyboard(self):
+        self.input_grid.addWidget(self.create_keyboard(), 1, 0, alignment=Qt.AlignTop | Qt.AlignLeft)
 
+    @Slot(bool)
     def toggle_definitions(self, checked):
         for table in self.tables.values():
             table.setColumnHidden(1, not checked)
@@ -612,6 +989,14 @@ class VocabVault(QMainWindow):
         layout.setContentsMargins(0, 5, 0, 0)
         layout.setSpacing(2)
         self.letter_buttons = []
+        
+        # (key, shifted) -> text to insert, so insert_char needs no case logic
+        self._char_map = {}
+        for key in KEY_ROW_YO + KEY_ROW_1 + KEY_ROW_2 + KEY_ROW_3:
+            self._char_map[(key, False)] = key
+            self._char_map[(key, True)] = key.upper()
+        for key in KEY_PUNCTUATION + (" ",):
+            self._char_map[(key, False)] = self._char_map[(key, True)] = key
 
         def create_key_row(keys, left_padding=0):
             row_layout = QHBoxLayout()
@@ -622,16 +1007,19 @@ class VocabVault(QMainWindow):
                 btn = QPushButton(key)
                 btn.setFixedSize(30, 30)
                 btn.setFocusPolicy(Qt.NoFocus)
-                btn.clicked.connect(lambda checked=False, k=key: self.insert_char(k))
+                btn.setProperty("key", key)
+                btn.clicked.connect(self.on_key_clicked)
                 row_layout.addWidget(btn)
                 if key.isalpha():
+                    btn.setProperty("lower", key)
+                    btn.setProperty("upper", key.upper())
                     self.letter_buttons.append(btn)
             row_layout.addStretch()
             return row_layout
 
-        layout.addLayout(create_key_row(["ё"], left_padding=10))
-        layout.addLayout(create_key_row("й ц у к е н г ш щ з х ъ".split(), left_padding=10))
-        layout.addLayout(create_key_row("ф ы в а п р о л д ж э".split(), left_padding=30))
+        layout.addLayout(create_key_row(KEY_ROW_YO, left_padding=10))
+        layout.addLayout(create_key_row(KEY_ROW_1, left_padding=10))
+        layout.addLayout(create_key_row(KEY_ROW_2, left_padding=30))
 
         row3_layout = QHBoxLayout()
         row3_layout.setSpacing(2)
@@ -642,19 +1030,23 @@ class VocabVault(QMainWindow):
         self.shift_btn.clicked.connect(self.toggle_shift)
         row3_layout.addWidget(self.shift_btn)
         
-        for key in "я ч с м и т ь б ю".split():
+        for key in KEY_ROW_3:
             btn = QPushButton(key)
             btn.setFixedSize(30, 30)
             btn.setFocusPolicy(Qt.NoFocus)
-            btn.clicked.connect(lambda checked=False, k=key: self.insert_char(k))
+            btn.setProperty("key", key)
+            btn.clicked.connect(self.on_key_clicked)
+            btn.setProperty("lower", key)
+            btn.setProperty("upper", key.upper())
             row3_layout.addWidget(btn)
             self.letter_buttons.append(btn)
         
-        for punct in [",", ".", "!", "?"]:
+        for punct in KEY_PUNCTUATION:
             btn = QPushButton(punct)
             btn.setFixedSize(30, 30)
             btn.setFocusPolicy(Qt.NoFocus)
-            btn.clicked.connect(lambda checked=False, k=punct: self.insert_char(k))
+            btn.setProperty("key", punct)
+            btn.clicked.connect(self.on_key_clicked)
             row3_layout.addWidget(btn)
             
         row3_layout.addStretch()
@@ -665,102 +1057,90 @@ class VocabVault(QMainWindow):
         space_btn.setFixedHeight(30)
         space_btn.setFocusPolicy(Qt.NoFocus)
         space_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        space_btn.clicked.connect(lambda: self.insert_char(" "))
+        space_btn.setProperty("key", " ")
+        space_btn.clicked.connect(self.on_key_clicked)
         row4_layout.addWidget(space_btn)
         layout.addLayout(row4_layout)
         layout.addStretch()
         return container
 
     def update_stats(self):
-        parts = []
-        total_items_count = 0
-        
-        for category in self.categories:
-            count = len(self.data[category])
-            total_items_count += count
-            display_name = category.replace("all ", "").title()
-            parts.append(f"{display_name}: {count}")
+        counts = [self.counts[category] for category in self.categories]
+        total_items_count = sum(counts)
         
-        current_total_score = 0
-        for category in self.categories:
-            for item in self.data[category]:
-                current_total_score += item.get('score', 0)
+        # Only a handful of distinct scores exist, so this is cheap regardless of vault size
+        current_total_score = sum(score * n for score, n in self.score_histogram.items())
         
         max_possible_score = total_items_count * self.MAX_SCORE
         
         score_color = "green" if current_total_score >= 0 else "red"
         
-        stats_text = "   |   ".join(parts)
+        stats_text = self._stats_template.format(*counts)
         final_text = (f"{stats_text}<br><br>"
                       f"<b>Total Mastery Score: <span style='color:{score_color};'>{current_total_score}</span> / {max_possible_score}</b>")
         
         self.stats_label.setText(final_text)
 
+    @Slot(bool)
     def toggle_shift(self, checked):
         self.is_shifted = checked
-        for btn in self.letter_buttons:
-            current_text = btn.text()
-            if self.is_shifted:
-                btn.setText(current_text.upper())
-            else:
-                btn.setText(current_text.lower())
+        # Both cases are stored on each button when the keyboard is built
+        key_attr = "upper" if checked else "lower"
+        # Relabel every key behind a single repaint of the keyboard
+        keyboard = self.shift_btn.parentWidget()
+        keyboard.setUpdatesEnabled(False)
+        try:
+            for btn in self.letter_buttons:
+                btn.setText(btn.property(key_attr))
+        finally:
+            keyboard.setUpdatesEnabled(True)
+
+    @Slot()
+    def on_key_clicked(self):
+        """Shared slot for every on-screen key; the key is stored on the button."""
+        self.insert_char(self.sender().property("key"))
 
     def insert_char(self, char):
-        if char == " ":
-            self.russian_input.insert(" ")
-            return
-        if char.isalpha():
-            to_insert = char.upper() if self.is_shifted else char.lower()
-        else:
-            to_insert = char
-        self.russian_input.insert(to_insert)
-        if self.is_shifted:
+        self.russian_input.insert(self._char_map[(char, self.is_shifted)])
+        # Shift only lasts for one key, but a space leaves it armed
+        if self.is_shifted and char != " ":
             self.shift_btn.setChecked(False)
             self.toggle_shift(False)
 
-    def refresh_table(self, category):
-        table = self.tables[category]
-        items = self.data[category]
-        table.setRowCount(0)
-        
-        for row_idx, item in enumerate(items):
-            table.insertRow(row_idx)
-            
-            table.setItem(row_idx, 0, QTableWidgetItem(item.get("russian", "")))
-            table.setItem(row_idx, 1, QTableWidgetItem(item.get("english", "")))
-            
-            score = item.get("score", 0)
-            score_item = QTableWidgetItem(str(score))
-            score_item.setTextAlignment(Qt.AlignCenter)
-            
-            if score > 0:
-                score_item.setForeground(QColor("green"))
-            elif score < 0:
-                score_item.setForeground(QColor("red"))
-                
-            table.setItem(row_idx, 2, score_item)
-            
-            container_widget = QWidget()
-            layout = QHBoxLayout(container_widget)
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.setAlignment(Qt.AlignCenter)
-            delete_btn = QPushButton("✕")
-            delete_btn.setFixedSize(30, 30)
-            delete_btn.setStyleSheet("""
-                QPushButton { color: #d32f2f; font-weight: bold; font-size: 18px; border: none; background: transparent; }
-                QPushButton:hover { color: red; font-weight: 900; }
-            """)
-            delete_btn.clicked.connect(lambda checked=False, c=category, r=row_idx: self.delete_entry(c, r))
-            layout.addWidget(delete_btn)
-            table.setCellWidget(row_idx, 3, container_widget)
+    def prefix_matches(self, category, prefix, limit=AUTOCOMPLETE_LIMIT):
+        """Returns up to limit Russian entries in category that start with prefix (case-insensitive)."""
+        keys = self.prefix_index[category]
+        prefix = prefix.lower()
+        matches = []
+        pos = bisect.bisect_left(keys, (prefix,))
+        while pos < len(keys) and len(matches) < limit and keys[pos][0].startswith(prefix):
+            matches.append(keys[pos][1])
+            pos += 1
+        return matches
+
+    @Slot(str)
+    def update_completions(self, text):
+        category = self.categories[self.tabs.currentIndex()]
+        self.completion_model.setStringList(self.prefix_matches(category, text) if text else [])
 
     def delete_entry(self, category, row_index):
         if 0 <= row_index < len(self.data[category]):
-            self.data[category].pop(row_index)
-            self.save_data()
-            self.refresh_table(category)
+            item = self.models[category].remove_item(row_index)
+            russian_text = item["russian"]
+            if self.index[category].get(russian_text) is item:
+                del self.index[category][russian_text]
+                keys = self.prefix_index[category]
+                key = (russian_text.lower(), russian_text)
+                pos = bisect.bisect_left(keys, key)
+                if pos < len(keys) and keys[pos] == key:
+                    del keys[pos]
+            self.counts[category] -= 1
+            self._move_in_histogram(item["score"], None)
+            self._move_in_buckets(category, item, item["score"], None)
+            self._mark_dirty()
             self.update_stats()
 
+    @Slot()
     def add_entry(self):
         russian_text = self.russian_input.text().strip()
         english_text = self.english_input.text().strip()
@@ -772,11 +1152,20 @@ class VocabVault(QMainWindow):
         current_index = self.tabs.currentIndex()
         current_category = self.categories[current_index]
         
-        new_entry = {"russian": russian_text, "english": english_text, "score": 0}
-        self.data[current_category].append(new_entry)
+        if russian_text in self.index[current_category]:
+            QMessageBox.warning(self, "Duplicate Entry", f"'{russian_text}' is already in {current_category.title()}.")
+            return
+        
+        new_entry = {"russian": sys.intern(russian_text), "english": sys.intern(english_text), "score": 0}
+        self.models[current_category].append_item(new_entry)
+        self.index[current_category][russian_text] = new_entry
+        bisect.insort(self.prefix_index[current_category], (russian_text.lower(), russian_text))
+        self.counts[current_category] += 1
+        self.score_histogram[0] += 1
+        self.score_buckets[current_category][0][id(new_entry)] = new_entry
         
-        self.save_data()
-        self.refresh_table(current_category)
+        self._mark_dirty()
+        self.tables[current_category].scrollToBottom()
         self.update_stats()
         
         self.russian_input.clear()